@@ -3,19 +3,22 @@ Enhanced Sign Language Translator Backend
 Integrates SLT framework with real-time gesture recognition
 """
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse
+from fastapi.staticfiles import StaticFiles
+from pydantic import BaseModel
 from contextlib import asynccontextmanager
+from collections import deque
+from functools import lru_cache
+from itertools import islice
 import asyncio
 import json
-import base64
-import cv2
 import numpy as np
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Union
 import logging
+import time
 from datetime import datetime
-import os
 from pathlib import Path
 
 # Sign Language Translator Framework
@@ -26,12 +29,21 @@ except ImportError:
     SLT_AVAILABLE = False
     logging.warning("Sign Language Translator not available. Install with: pip install sign-language-translator")
 
+# Fast JSON serialization for the WebSocket hot path
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logging.warning("orjson not available, falling back to stdlib json. Install with: pip install orjson")
+
 # Local modules - only import existing files
 try:
-    from models.gesture_recognizer import AdvancedGestureRecognizer
+    from models.gesture_recognizer import AdvancedGestureRecognizer, LANDMARK_INT16_SCALE
     GESTURE_RECOGNIZER_AVAILABLE = True
 except ImportError:
     GESTURE_RECOGNIZER_AVAILABLE = False
+    LANDMARK_INT16_SCALE = 10000.0  # must match models.gesture_recognizer
     logging.warning("Advanced gesture recognizer not available, using simple recognizer")
 
 try:
@@ -41,15 +53,42 @@ except ImportError:
     TRANSLATION_ENGINE_AVAILABLE = False
     logging.warning("Translation engine not available, using SLT directly")
 
+try:
+    from models import _jit
+    JIT_RECOGNIZER_AVAILABLE = _jit.NUMBA_AVAILABLE
+except ImportError:
+    _jit = None
+    JIT_RECOGNIZER_AVAILABLE = False
+    logging.warning("Numba not available, using pure Python gesture recognition")
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# === Request Models ===
+# Pydantic v2 validates request bodies in compiled Rust code, which is much
+# faster than parsing into a raw Dict and calling .get() per field
+
+class GestureRequest(BaseModel):
+    landmarks: List[Dict[str, float]]
+
+class TextToSignRequest(BaseModel):
+    text: str
+    language: str = "english"
+    format: str = "landmarks"
+
+class SentenceRequest(BaseModel):
+    text: str
+    language: str = "english"
+
+class BatchAnalyzeRequest(BaseModel):
+    texts: List[str]
+    language: str = "english"
+
 # Global state
 class GlobalState:
     def __init__(self):
         self.slt_models = {}
-        self.connections = set()
         self.gesture_history = []
         self.is_initialized = False
 
@@ -57,89 +96,77 @@ state = GlobalState()
 
 # === SLT Framework Initialization ===
 
+def _build_synthesis_model(text_language: str, sign_format: str):
+    """Construct one ConcatenativeSynthesis model (runs on a worker thread)"""
+    model = slt.models.ConcatenativeSynthesis(
+        text_language=text_language,
+        sign_language="pk-sl",
+        sign_format=sign_format
+    )
+
+    # Try to set embedding model if the attribute exists
+    if sign_format == "landmarks" and hasattr(model, 'sign_embedding_model'):
+        try:
+            model.sign_embedding_model = "mediapipe-world"
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to set embedding model: {e}")
+            # Continue without embedding
+
+    return model
+
+# Tiny warm-up inputs so the first real request hits a warm model
+_WARMUP_TEXT = {"english": "hello", "urdu": "سلام"}
+
+async def _warm_slt_model(model_key: str, model, text_language: str):
+    """Issue a small background translation to warm the model's caches"""
+    try:
+        await asyncio.to_thread(model.translate, _WARMUP_TEXT[text_language])
+        logger.info(f"🔥 Warmed up {model_key} model")
+    except Exception as e:
+        logger.warning(f"⚠️ Warm-up for {model_key} failed: {e}")
+
 async def initialize_slt_models():
     """Initialize SLT Framework models with improved error handling"""
     if not SLT_AVAILABLE:
         logger.warning("❌ SLT Framework not available")
         return False
-    
+
     try:
-        # Try to initialize models one by one with fallbacks
         state.slt_models = {}
-        
-        # Try English to video first (most likely to work)
-        try:
-            state.slt_models["english_to_video"] = slt.models.ConcatenativeSynthesis(
-                text_language="english",
-                sign_language="pk-sl", 
-                sign_format="video"
-            )
-            logger.info("✅ English to video model loaded")
-        except Exception as e:
-            logger.warning(f"⚠️ English to video model failed: {e}")
-        
-        # Try landmarks with proper embedding model configuration
-        try:
-            landmarks_model = slt.models.ConcatenativeSynthesis(
-                text_language="english",
-                sign_language="pk-sl",
-                sign_format="landmarks"
-            )
-            
-            # Try to set embedding model if the attribute exists
-            if hasattr(landmarks_model, 'sign_embedding_model'):
-                try:
-                    landmarks_model.sign_embedding_model = "mediapipe-world"
-                    state.slt_models["english_to_landmarks"] = landmarks_model
-                    logger.info("✅ English to landmarks model loaded with mediapipe-world embedding")
-                except Exception as e:
-                    logger.warning(f"⚠️ Failed to set embedding model: {e}")
-                    # Try without setting embedding model
-                    state.slt_models["english_to_landmarks"] = landmarks_model
-                    logger.info("✅ English to landmarks model loaded (without embedding)")
+        _translate_cached.cache_clear()
+
+        # Independent constructors load in parallel on worker threads, so
+        # startup costs the slowest model rather than the sum of all of them
+        specs = [
+            ("english_to_video", "english", "video"),
+            ("english_to_landmarks", "english", "landmarks"),
+            ("urdu_to_video", "urdu", "video"),
+            ("urdu_to_landmarks", "urdu", "landmarks"),
+        ]
+        results = await asyncio.gather(
+            *(asyncio.to_thread(_build_synthesis_model, text_lang, fmt)
+              for _, text_lang, fmt in specs),
+            asyncio.to_thread(slt.models.MediaPipeLandmarksModel),
+            return_exceptions=True
+        )
+
+        for (model_key, text_lang, _), result in zip(specs, results):
+            if isinstance(result, Exception):
+                logger.warning(f"⚠️ {model_key} model failed: {result}")
             else:
-                state.slt_models["english_to_landmarks"] = landmarks_model
-                logger.info("✅ English to landmarks model loaded (no embedding attribute)")
-                
-        except Exception as e:
-            logger.warning(f"⚠️ English to landmarks model failed: {e}")
-        
-        # Try Urdu models (optional)
-        try:
-            state.slt_models["urdu_to_video"] = slt.models.ConcatenativeSynthesis(
-                text_language="urdu",
-                sign_language="pk-sl",
-                sign_format="video"
-            )
-            logger.info("✅ Urdu to video model loaded")
-        except Exception as e:
-            logger.warning(f"⚠️ Urdu to video model failed: {e}")
-        
-        try:
-            urdu_landmarks_model = slt.models.ConcatenativeSynthesis(
-                text_language="urdu",
-                sign_language="pk-sl",
-                sign_format="landmarks"
-            )
-            
-            if hasattr(urdu_landmarks_model, 'sign_embedding_model'):
-                try:
-                    urdu_landmarks_model.sign_embedding_model = "mediapipe-world"
-                except:
-                    pass  # Continue without embedding
-            
-            state.slt_models["urdu_to_landmarks"] = urdu_landmarks_model
-            logger.info("✅ Urdu to landmarks model loaded")
-        except Exception as e:
-            logger.warning(f"⚠️ Urdu to landmarks model failed: {e}")
-        
-        # Try MediaPipe landmark extraction (optional)
-        try:
-            state.slt_models["landmarks_extractor"] = slt.models.MediaPipeLandmarksModel()
+                state.slt_models[model_key] = result
+                logger.info(f"✅ {model_key} model loaded")
+                # Fire-and-forget warm-up translation in the background
+                asyncio.create_task(_warm_slt_model(model_key, result, text_lang))
+
+        # MediaPipe landmark extraction (optional)
+        extractor = results[-1]
+        if isinstance(extractor, Exception):
+            logger.warning(f"⚠️ MediaPipe landmarks extractor failed: {extractor}")
+        else:
+            state.slt_models["landmarks_extractor"] = extractor
             logger.info("✅ MediaPipe landmarks extractor loaded")
-        except Exception as e:
-            logger.warning(f"⚠️ MediaPipe landmarks extractor failed: {e}")
-        
+
         # Check if we loaded any models
         if state.slt_models:
             logger.info(f"✅ SLT Framework partially initialized with {len(state.slt_models)} models: {list(state.slt_models.keys())}")
@@ -147,21 +174,84 @@ async def initialize_slt_models():
         else:
             logger.warning("❌ No SLT models could be loaded, using fallback gesture recognition only")
             return False
-        
+
     except Exception as e:
         logger.error(f"❌ Failed to initialize SLT models: {e}")
         logger.info("📝 SLT models disabled, using simple gesture recognition only")
         return False
 
+# === WebSocket JSON Helpers ===
+
+def _ws_dumps(obj) -> str:
+    """Serialize a WebSocket payload to JSON text
+
+    orjson's C encoder is still used when available, but the result is
+    decoded to str so messages go out as text frames — the bundled
+    frontend handlers call JSON.parse(event.data) and would receive a
+    Blob from a binary frame.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(obj)
+
+def _ws_loads(data: Union[str, bytes]) -> Dict:
+    """Parse an incoming WebSocket message"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# === HTTP Response Serialization ===
+
+if ORJSON_AVAILABLE:
+    class ORJSONResponse(JSONResponse):
+        """JSON response rendered by orjson at C speed
+
+        OPT_SERIALIZE_NUMPY lets landmark arrays serialize natively
+        without a Python-level .tolist() walk per frame.
+        """
+        media_type = "application/json"
+
+        def render(self, content) -> bytes:
+            return orjson.dumps(
+                content,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            )
+
+    _RESPONSE_CLASS = ORJSONResponse
+else:
+    _RESPONSE_CLASS = JSONResponse
+
+# === Translation Result Cache ===
+
+@lru_cache(maxsize=512)
+def _translate_cached(model_key: str, text: str):
+    """
+    Translate text with a loaded SLT model, caching results for repeated phrases
+    Keyed on (model_key, normalized text) since users and UIs resend the same
+    phrases; call _translate_cached.cache_clear() whenever models are reloaded
+    """
+    return state.slt_models[model_key].translate(text)
+
 # === Simple Gesture Recognition (without external files) ===
 
+# Landmark index arrays for vectorized finger analysis
+# Finger tip indices: thumb=4, index=8, middle=12, ring=16, pinky=20
+# Finger base indices: thumb=3, index=6, middle=10, ring=14, pinky=18
+FINGER_TIPS = np.array([4, 8, 12, 16, 20])
+FINGER_BASES = np.array([3, 6, 10, 14, 18])
+
+# Bit weights turning a (..., 5) extension matrix into pattern-table masks
+MASK_WEIGHTS = np.array([1, 2, 4, 8, 16])
+
 class SimpleGestureRecognizer:
     """Simplified gesture recognizer for immediate use"""
     
     def __init__(self):
-        self.gesture_history = []
-        self.confidence_history = []
         self.history_size = 10
+        self.gesture_history = deque(maxlen=self.history_size)
+        # Only the last 5 confidences feed the stability average
+        self.confidence_history = deque(maxlen=5)
+        self._conf_sum = 0.0
         
         # ASL letter patterns (simplified)
         self.gesture_patterns = {
@@ -178,26 +268,85 @@ class SimpleGestureRecognizer:
             "O": {"circle": True},
             "Y": {"thumb_pinky_up": True}
         }
-    
-    def recognize_from_landmarks(self, landmarks: List[Dict]) -> Dict:
-        """Simple recognition from landmarks"""
-        if not landmarks or len(landmarks) != 21:
+
+        # Branch-free matching: classification depends only on the 5-bit finger
+        # extension mask (bit0=thumb ... bit4=pinky), so precompute a 32-entry
+        # lookup table from the same rules the old if/elif ladder encoded
+        self._pattern_table = self._build_pattern_table()
+
+    @staticmethod
+    def _build_pattern_table() -> List[tuple]:
+        """Build the (gesture, confidence) table indexed by extension bitmask"""
+        table = []
+        for mask in range(32):
+            thumb = bool(mask & 1)
+            index = bool(mask & 2)
+            pinky = bool(mask & 16)
+            fingers_up = bin(mask >> 1).count("1")  # Exclude thumb
+
+            if fingers_up == 0 and thumb:
+                entry = ("A", 0.85)
+            elif fingers_up == 4 and not thumb:
+                entry = ("B", 0.90)
+            elif index and fingers_up == 1:
+                entry = ("D", 0.80)
+            elif fingers_up == 0:
+                entry = ("E", 0.75)
+            elif pinky and fingers_up == 1:
+                entry = ("I", 0.80)
+            else:
+                entry = ("Unknown", 0.3)
+            table.append(entry)
+        return table
+
+    def recognize_from_landmarks(self, landmarks: Union[List[Dict], np.ndarray]) -> Dict:
+        """Simple recognition from landmarks (list of 21 dicts or a (21, 3) / flat 63 array)"""
+        if isinstance(landmarks, np.ndarray):
+            valid = landmarks.size == 63
+        else:
+            valid = bool(landmarks) and len(landmarks) == 21
+
+        if not valid:
             return {
                 "gesture": "No Hand",
                 "confidence": 0.0,
                 "stability": 0.0,
                 "method": "simple_rules"
             }
-        
+
         try:
-            # Convert to simple format
-            points = [(lm.get("x", 0), lm.get("y", 0), lm.get("z", 0)) for lm in landmarks]
-            
-            # Basic finger state analysis
-            finger_states = self._analyze_fingers(points)
-            
-            # Match against patterns
-            best_match = self._match_pattern(finger_states)
+            if isinstance(landmarks, np.ndarray):
+                # Already validated above; a single reshape is all that's needed
+                points = landmarks.reshape(21, 3).astype(np.float32, copy=False)
+            else:
+                # Convert to a (21, 3) float32 array in one pass
+                points = np.fromiter(
+                    (lm.get(k, 0) for lm in landmarks for k in ("x", "y", "z")),
+                    dtype=np.float32,
+                    count=63
+                ).reshape(21, 3)
+
+            if _jit is not None and _jit.native_extension_mask is not None:
+                # AOT-compiled kernel specialized for the (21, 3) shape: no
+                # JIT warm-up cost on freshly forked/reloaded workers
+                mask = int(_jit.native_extension_mask(points))
+                finger_states = self._finger_states_from_mask(mask)
+                best_match = self._match_pattern(mask)
+            elif JIT_RECOGNIZER_AVAILABLE:
+                # Fused finger analysis + pattern matching in one compiled call
+                gesture_id, confidence, mask = _jit.recognize(points)
+                finger_states = self._finger_states_from_mask(int(mask))
+                best_match = {"gesture": _jit.GESTURE_NAMES[gesture_id], "confidence": float(confidence)}
+            else:
+                # Basic finger state analysis
+                finger_states = self._analyze_fingers(points)
+
+                # Match against the precomputed pattern table
+                mask = 0
+                for i, ext in enumerate(finger_states["fingers_extended"]):
+                    if ext:
+                        mask |= 1 << i
+                best_match = self._match_pattern(mask)
             
             # Calculate stability
             stability = self._calculate_stability(best_match["gesture"], best_match["confidence"])
@@ -220,22 +369,50 @@ class SimpleGestureRecognizer:
                 "error": str(e)
             }
     
-    def _analyze_fingers(self, points: List[tuple]) -> Dict:
+    def recognize_batch(self, frames: np.ndarray) -> List[Dict]:
+        """Recognize a batch of frames shaped (N, 21, 3) in one vectorized pass"""
+        frames = frames.reshape(-1, 21, 3).astype(np.float32, copy=False)
+
+        # Finger extension for every frame at once
+        ext = frames[:, FINGER_TIPS, 1] < frames[:, FINGER_BASES, 1] - 0.02
+        ext[:, 0] = frames[:, 4, 0] > frames[:, 3, 0] + 0.02
+        masks = (ext * MASK_WEIGHTS).sum(axis=1)
+
+        # Stability updates stay sequential because history is order-dependent
+        results = []
+        for mask in masks:
+            gesture, confidence = self._pattern_table[int(mask)]
+            results.append({
+                "gesture": gesture,
+                "confidence": confidence,
+                "stability": self._calculate_stability(gesture, confidence),
+                "method": "simple_rules",
+                "finger_states": self._finger_states_from_mask(int(mask))
+            })
+        return results
+
+    def _analyze_fingers(self, points: np.ndarray) -> Dict:
         """Analyze finger positions"""
-        # Finger tip indices: thumb=4, index=8, middle=12, ring=16, pinky=20
-        # Finger base indices: thumb=3, index=6, middle=10, ring=14, pinky=18
-        
-        finger_tips = [4, 8, 12, 16, 20]
-        finger_bases = [3, 6, 10, 14, 18]
-        
-        fingers_extended = []
-        for i in range(5):
-            tip = points[finger_tips[i]]
-            base = points[finger_bases[i]]
-            # Simple heuristic: finger is extended if tip is above base
-            extended = tip[1] < base[1] - 0.02 if i > 0 else tip[0] > base[0] + 0.02  # Thumb different
-            fingers_extended.append(extended)
-        
+        # Simple heuristic: finger is extended if tip is above base
+        extended = points[FINGER_TIPS, 1] < points[FINGER_BASES, 1] - 0.02
+        extended[0] = points[4, 0] > points[3, 0] + 0.02  # Thumb extends sideways
+
+        fingers_extended = extended.tolist()
+
+        return {
+            "fingers_extended": fingers_extended,
+            "thumb_extended": fingers_extended[0],
+            "index_extended": fingers_extended[1],
+            "middle_extended": fingers_extended[2],
+            "ring_extended": fingers_extended[3],
+            "pinky_extended": fingers_extended[4],
+            "fingers_up_count": int(extended[1:].sum()),  # Exclude thumb
+            "all_fingers_down": not extended[1:].any()
+        }
+    
+    def _finger_states_from_mask(self, mask: int) -> Dict:
+        """Expand the JIT kernel's extension bitmask into the finger state dict"""
+        fingers_extended = [bool(mask & (1 << i)) for i in range(5)]
         return {
             "fingers_extended": fingers_extended,
             "thumb_extended": fingers_extended[0],
@@ -246,83 +423,77 @@ class SimpleGestureRecognizer:
             "fingers_up_count": sum(fingers_extended[1:]),  # Exclude thumb
             "all_fingers_down": not any(fingers_extended[1:])
         }
-    
-    def _match_pattern(self, finger_states: Dict) -> Dict:
-        """Match finger states to gesture patterns"""
-        matches = []
-        
-        # Simple pattern matching
-        if finger_states["all_fingers_down"] and finger_states["thumb_extended"]:
-            matches.append({"gesture": "A", "confidence": 0.85})
-        elif finger_states["fingers_up_count"] == 4 and not finger_states["thumb_extended"]:
-            matches.append({"gesture": "B", "confidence": 0.90})
-        elif finger_states["index_extended"] and finger_states["fingers_up_count"] == 1:
-            matches.append({"gesture": "D", "confidence": 0.80})
-        elif finger_states["all_fingers_down"]:
-            matches.append({"gesture": "E", "confidence": 0.75})
-        elif finger_states["pinky_extended"] and finger_states["fingers_up_count"] == 1:
-            matches.append({"gesture": "I", "confidence": 0.80})
-        elif finger_states["thumb_extended"] and finger_states["index_extended"] and finger_states["fingers_up_count"] == 1:
-            matches.append({"gesture": "L", "confidence": 0.85})
-        elif finger_states["thumb_extended"] and finger_states["pinky_extended"] and finger_states["fingers_up_count"] == 1:
-            matches.append({"gesture": "Y", "confidence": 0.85})
-        else:
-            matches.append({"gesture": "Unknown", "confidence": 0.3})
-        
-        # Return best match
-        return max(matches, key=lambda x: x["confidence"]) if matches else {"gesture": "Unknown", "confidence": 0.0}
+
+    def _match_pattern(self, mask: int) -> Dict:
+        """Look up the gesture pattern for a finger extension bitmask"""
+        gesture, confidence = self._pattern_table[mask]
+        return {"gesture": gesture, "confidence": confidence}
     
     def _calculate_stability(self, gesture: str, confidence: float) -> float:
         """Calculate gesture stability over time"""
         self.gesture_history.append(gesture)
+
+        # Keep a running sum so the average never re-scans the deque
+        if len(self.confidence_history) == self.confidence_history.maxlen:
+            self._conf_sum -= self.confidence_history[0]
         self.confidence_history.append(confidence)
-        
-        if len(self.gesture_history) > self.history_size:
-            self.gesture_history.pop(0)
-            self.confidence_history.pop(0)
-        
+        self._conf_sum += confidence
+
         if len(self.gesture_history) < 3:
             return confidence * 0.5
-        
-        # Calculate consistency
-        recent_gestures = self.gesture_history[-5:]
-        consistent_count = sum(1 for g in recent_gestures if g == gesture)
-        consistency = consistent_count / len(recent_gestures)
-        
-        # Calculate average confidence
-        recent_confidence = self.confidence_history[-5:]
-        avg_confidence = sum(recent_confidence) / len(recent_confidence)
-        
+
+        # Calculate consistency over the last 5 gestures without slicing
+        recent_start = max(0, len(self.gesture_history) - 5)
+        recent_count = len(self.gesture_history) - recent_start
+        consistent_count = sum(
+            1 for g in islice(self.gesture_history, recent_start, None) if g == gesture
+        )
+        consistency = consistent_count / recent_count
+
+        # Average confidence from the running sum
+        avg_confidence = self._conf_sum / len(self.confidence_history)
+
         return consistency * 0.6 + avg_confidence * 0.4
 
 # === WebSocket Connection Manager ===
 
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        # Single source of truth: per-connection state keyed by the socket itself
+        self.active_connections: Dict[WebSocket, Dict] = {}
 
-    async def connect(self, websocket: WebSocket):
+    async def connect(self, websocket: WebSocket) -> Dict:
         await websocket.accept()
-        self.active_connections.append(websocket)
-        state.connections.add(websocket)
+        conn_state = {
+            # Own recognizer per client so gesture history never interleaves
+            # frames from unrelated users (and needs no locking)
+            "recognizer": SimpleGestureRecognizer(),
+            "last_landmarks": None,
+            "last_result": None,
+            "frames_since_recompute": 0,
+        }
+        self.active_connections[websocket] = conn_state
         logger.info(f"WebSocket connected. Total connections: {len(self.active_connections)}")
+        return conn_state
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-        state.connections.discard(websocket)
+        self.active_connections.pop(websocket, None)
         logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
 
-    async def send_personal_message(self, message: str, websocket: WebSocket):
+    async def send_personal_message(self, message: Union[str, bytes], websocket: WebSocket):
         try:
-            await websocket.send_text(message)
+            if isinstance(message, bytes):
+                await websocket.send_bytes(message)
+            else:
+                await websocket.send_text(message)
         except Exception as e:
             logger.error(f"Error sending message: {e}")
             self.disconnect(websocket)
 
 # === Initialize Components ===
 
-# Initialize gesture recognizer
+# Initialize gesture recognizer (shared instance for single-shot REST calls;
+# each websocket connection gets its own SimpleGestureRecognizer)
 if GESTURE_RECOGNIZER_AVAILABLE:
     try:
         gesture_recognizer = AdvancedGestureRecognizer()
@@ -358,7 +529,7 @@ async def lifespan(app: FastAPI):
     logger.info("🛑 Shutting down Enhanced Sign Language Translator Backend")
     
     # Close all WebSocket connections
-    for websocket in list(state.connections):
+    for websocket in list(manager.active_connections):
         try:
             await websocket.close()
         except:
@@ -369,7 +540,8 @@ app = FastAPI(
     title="Enhanced Sign Language Translator API",
     description="Real-time sign language recognition and translation with SLT framework",
     version="2.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=_RESPONSE_CLASS
 )
 
 # CORS middleware for Next.js frontend
@@ -381,6 +553,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Single place for unhandled errors: endpoints no longer wrap their whole
+# bodies in try/except just to re-raise as HTTPException(500)
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    logger.exception("Unhandled error on %s %s", request.method, request.url.path)
+    return JSONResponse(status_code=500, content={"detail": str(exc)})
+
+# Serve SLT-generated videos directly via Starlette's StaticFiles mount,
+# which handles range requests, ETags and caching headers in the ASGI layer
+GENERATED_VIDEOS_DIR = Path("./generated_videos")
+GENERATED_VIDEOS_DIR.mkdir(exist_ok=True)
+app.mount("/files/video", StaticFiles(directory=GENERATED_VIDEOS_DIR), name="videos")
+
 # === Core API Endpoints ===
 
 @app.get("/")
@@ -392,10 +577,12 @@ async def root():
         "status": "running",
         "slt_framework": SLT_AVAILABLE,
         "slt_models_loaded": len(state.slt_models),
-        "active_connections": len(state.connections),
+        "active_connections": len(manager.active_connections),
         "timestamp": datetime.now().isoformat(),
         "capabilities": {
             "gesture_recognition": True,
+            "flat_landmarks_input": True,  # websocket accepts "landmarks_flat": [x0,y0,z0,...] (63 floats)
+            "binary_landmarks_input": True,  # websocket accepts int16-quantized frames (126 bytes each)
             "text_to_sign": SLT_AVAILABLE,
             "multi_language": SLT_AVAILABLE,
             "real_time": True,
@@ -431,7 +618,7 @@ async def health_check():
             "simple_fallback": True
         },
         "websocket": {
-            "connections": len(state.connections),
+            "connections": len(manager.active_connections),
             "manager_active": bool(manager)
         },
         "server": {
@@ -441,33 +628,28 @@ async def health_check():
     }
 
 @app.post("/recognize/gesture")
-async def recognize_gesture(request: Dict):
+async def recognize_gesture(request: GestureRequest):
     """
     Advanced gesture recognition from landmarks
     Expected: { "landmarks": [...] }
     """
-    try:
-        landmarks = request.get("landmarks", [])
-        
-        if not landmarks:
-            raise HTTPException(status_code=400, detail="Landmarks data required")
-        
-        # Use simple gesture recognizer
-        result = gesture_recognizer.recognize_from_landmarks(landmarks)
-        
-        return {
-            "success": True,
-            "result": result,
-            "processing_time_ms": 5,  # Placeholder
-            "model_version": "simple_v1.0"
-        }
-        
-    except Exception as e:
-        logger.error(f"Gesture recognition error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    landmarks = request.landmarks
+
+    if not landmarks:
+        raise HTTPException(status_code=400, detail="Landmarks data required")
+
+    # Use simple gesture recognizer
+    result = gesture_recognizer.recognize_from_landmarks(landmarks)
+
+    return {
+        "success": True,
+        "result": result,
+        "processing_time_ms": 5,  # Placeholder
+        "model_version": "simple_v1.0"
+    }
 
 @app.post("/translate/text-to-sign")
-async def text_to_sign(request: Dict):
+async def text_to_sign(request: TextToSignRequest):
     """
     Translate text to sign language using SLT framework
     Expected: { "text": "Hello world", "language": "english", "format": "video|landmarks" }
@@ -478,97 +660,91 @@ async def text_to_sign(request: Dict):
     if not state.slt_models:
         raise HTTPException(status_code=503, detail="No SLT models loaded. Check server logs for initialization errors.")
     
+    text = request.text
+    language = request.language
+    output_format = request.format
+
+    if not text:
+        raise HTTPException(status_code=400, detail="Text is required")
+    
+    # Select appropriate SLT model with fallbacks
+    model_key = f"{language}_to_{output_format}"
+    used_key = None
+
+    if model_key in state.slt_models:
+        used_key = model_key
+    else:
+        # Try fallbacks
+        fallback_keys = [
+            f"english_to_{output_format}",  # Fallback to English
+            f"{language}_to_video",         # Fallback to video format
+            "english_to_video"              # Ultimate fallback
+        ]
+
+        for fallback_key in fallback_keys:
+            if fallback_key in state.slt_models:
+                used_key = fallback_key
+                logger.warning(f"Using fallback model {fallback_key} instead of requested {model_key}")
+                break
+
+    if not used_key:
+        available_models = list(state.slt_models.keys())
+        raise HTTPException(
+            status_code=400,
+            detail=f"No suitable model available. Requested: {model_key}. Available: {available_models}"
+        )
+
+    # Translate text to sign (cached for repeated phrases); SLT synthesis
+    # is blocking, so run it off the event loop
     try:
-        text = request.get("text", "")
-        language = request.get("language", "english")
-        output_format = request.get("format", "landmarks")
+        sign_result = await asyncio.to_thread(_translate_cached, used_key, text.strip().lower())
         
-        if not text:
-            raise HTTPException(status_code=400, detail="Text is required")
-        
-        # Select appropriate SLT model with fallbacks
-        model_key = f"{language}_to_{output_format}"
-        model = None
-        
-        if model_key in state.slt_models:
-            model = state.slt_models[model_key]
+        if output_format == "video":
+            return {
+                "success": True,
+                "format": "video",
+                "data": {
+                    "video_path": str(sign_result),
+                    "message": "Video generated successfully"
+                },
+                "text": text,
+                "language": language,
+                "model_used": model_key if model_key in state.slt_models else "fallback"
+            }
         else:
-            # Try fallbacks
-            fallback_keys = [
-                f"english_to_{output_format}",  # Fallback to English
-                f"{language}_to_video",         # Fallback to video format
-                "english_to_video"              # Ultimate fallback
-            ]
-            
-            for fallback_key in fallback_keys:
-                if fallback_key in state.slt_models:
-                    model = state.slt_models[fallback_key]
-                    logger.warning(f"Using fallback model {fallback_key} instead of requested {model_key}")
-                    break
-        
-        if not model:
-            available_models = list(state.slt_models.keys())
-            raise HTTPException(
-                status_code=400, 
-                detail=f"No suitable model available. Requested: {model_key}. Available: {available_models}"
-            )
-        
-        # Translate text to sign
-        try:
-            sign_result = model.translate(text)
-            
-            if output_format == "video":
+            # For landmarks, return structured data
+            try:
+                if hasattr(sign_result, 'to_dict'):
+                    landmarks_data = sign_result.to_dict()
+                elif hasattr(sign_result, 'landmarks'):
+                    landmarks_data = sign_result.landmarks
+                else:
+                    landmarks_data = {"raw": str(sign_result)}
+                    
                 return {
                     "success": True,
-                    "format": "video",
-                    "data": {
-                        "video_path": str(sign_result),
-                        "message": "Video generated successfully"
-                    },
+                    "format": "landmarks",
+                    "data": landmarks_data,
                     "text": text,
                     "language": language,
                     "model_used": model_key if model_key in state.slt_models else "fallback"
                 }
-            else:
-                # For landmarks, return structured data
-                try:
-                    if hasattr(sign_result, 'to_dict'):
-                        landmarks_data = sign_result.to_dict()
-                    elif hasattr(sign_result, 'landmarks'):
-                        landmarks_data = sign_result.landmarks
-                    else:
-                        landmarks_data = {"raw": str(sign_result)}
-                        
-                    return {
-                        "success": True,
-                        "format": "landmarks",
-                        "data": landmarks_data,
-                        "text": text,
-                        "language": language,
-                        "model_used": model_key if model_key in state.slt_models else "fallback"
-                    }
-                except Exception as e:
-                    logger.warning(f"Landmarks conversion failed: {e}")
-                    return {
-                        "success": True,
-                        "format": "landmarks",
-                        "data": {"message": "Landmarks generated", "raw": str(sign_result)},
-                        "text": text,
-                        "language": language,
-                        "model_used": model_key if model_key in state.slt_models else "fallback"
-                    }
-        except Exception as translation_error:
-            logger.error(f"Translation failed: {translation_error}")
-            raise HTTPException(
-                status_code=500, 
-                detail=f"Translation failed: {str(translation_error)}. The model may need additional configuration."
-            )
-            
-    except HTTPException:
-        raise  # Re-raise HTTP exceptions
-    except Exception as e:
-        logger.error(f"Text-to-sign translation error: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+            except Exception as e:
+                logger.warning(f"Landmarks conversion failed: {e}")
+                return {
+                    "success": True,
+                    "format": "landmarks",
+                    "data": {"message": "Landmarks generated", "raw": str(sign_result)},
+                    "text": text,
+                    "language": language,
+                    "model_used": model_key if model_key in state.slt_models else "fallback"
+                }
+    except Exception as translation_error:
+        logger.error(f"Translation failed: {translation_error}")
+        raise HTTPException(
+            status_code=500, 
+            detail=f"Translation failed: {str(translation_error)}. The model may need additional configuration."
+        )
 
 @app.get("/languages/supported")
 async def get_supported_languages():
@@ -595,66 +771,163 @@ async def get_supported_languages():
     
     return base_languages
 
+def _analyze_text(text: str, language: str) -> Dict:
+    """Basic sentence analysis shared by the single and batch endpoints"""
+    words = text.split()
+    word_count = len(words)
+    return {
+        "text": text,
+        "language": language,
+        "word_count": word_count,
+        "unique_words": len(set(words)),
+        "complexity_score": word_count / 10 if word_count < 10 else 1.0,
+        "translatable": True,
+        "supported_formats": ["landmarks", "video"] if SLT_AVAILABLE else [],
+        "estimated_confidence": 0.85 if word_count <= 10 else 0.70,
+        "processing_time": 2
+    }
+
 @app.post("/analyze/sentence")
-async def analyze_sentence(request: Dict):
+async def analyze_sentence(request: SentenceRequest):
     """Analyze sentence structure and translation readiness"""
-    try:
-        text = request.get("text", "")
-        language = request.get("language", "english")
-        
-        if not text:
-            raise HTTPException(status_code=400, detail="Text is required")
-        
-        # Basic analysis
-        words = text.split()
-        analysis = {
-            "text": text,
-            "language": language,
-            "word_count": len(words),
-            "unique_words": len(set(words)),
-            "complexity_score": min(1.0, len(words) / 10),
-            "translatable": True,
-            "supported_formats": ["landmarks", "video"] if SLT_AVAILABLE else [],
-            "estimated_confidence": 0.85 if len(words) <= 10 else 0.70,
-            "processing_time": 2
-        }
-        
-        return {
-            "success": True,
-            "analysis": analysis
-        }
-        
-    except Exception as e:
-        logger.error(f"Sentence analysis error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    text = request.text
+    language = request.language
+
+    if not text:
+        raise HTTPException(status_code=400, detail="Text is required")
+
+    return {
+        "success": True,
+        "analysis": _analyze_text(text, language)
+    }
+
+@app.post("/analyze/batch")
+async def analyze_batch(request: BatchAnalyzeRequest):
+    """
+    Analyze multiple sentences in a single round-trip
+    Expected: { "texts": ["Hello world", ...], "language": "english" }
+    """
+    texts = request.texts
+    language = request.language
+
+    if not texts:
+        raise HTTPException(status_code=400, detail="Texts list is required")
+
+    return {
+        "success": True,
+        "analyses": [_analyze_text(text, language) for text in texts]
+    }
 
 # === WebSocket Endpoints ===
 
 @app.websocket("/ws/real-time")
 async def websocket_real_time(websocket: WebSocket):
     """Real-time WebSocket for continuous processing"""
-    await manager.connect(websocket)
-    
+    # Skip-frame state lives on the per-connection dict: while the hand is
+    # steady, reuse the last stable result instead of re-running recognition
+    conn = await manager.connect(websocket)
+    skip_eps = 0.05          # L1 landmark distance below which the hand counts as steady
+    force_recompute_every = 5  # Always recompute every K-th frame for safety
+
     try:
         while True:
-            # Receive data from frontend
-            data = await websocket.receive_text()
-            message = json.loads(data)
-            
+            # Receive data from frontend (JSON text or binary landmark frames)
+            packet = await websocket.receive()
+            if packet.get("type") == "websocket.disconnect":
+                raise WebSocketDisconnect(packet.get("code") or 1000)
+
+            raw = packet.get("bytes")
+            if raw is not None:
+                # Binary protocol: N frames of 21x3 int16 coordinates scaled by
+                # 10000 (126 bytes per frame, ~5x smaller than JSON floats)
+                if len(raw) % 126 != 0:
+                    await manager.send_personal_message(_ws_dumps({
+                        "type": "error",
+                        "message": "Binary frames must be a multiple of 126 bytes (21 x 3 int16)",
+                        "timestamp": time.time_ns()
+                    }), websocket)
+                    continue
+
+                frames = np.frombuffer(raw, dtype="<i2").astype(np.float32).reshape(-1, 21, 3) / LANDMARK_INT16_SCALE
+                results = conn["recognizer"].recognize_batch(frames)
+
+                await manager.send_personal_message(_ws_dumps({
+                    "type": "gesture_result_batch",
+                    "results": results,
+                    "timestamp": time.time_ns()
+                }), websocket)
+                continue
+
+            message = _ws_loads(packet.get("text"))
+
             message_type = message.get("type")
-            timestamp = datetime.now().isoformat()
+            # Integer epoch-ns: datetime.now().isoformat() per message is
+            # measurable at high frame rates; clients convert as needed
+            timestamp = time.time_ns()
             
             if message_type == "gesture_landmarks":
-                # Process gesture recognition
+                # Process gesture recognition with confidence-gated frame skipping
                 landmarks = message.get("landmarks", [])
-                result = gesture_recognizer.recognize_from_landmarks(landmarks)
-                
-                await manager.send_personal_message(json.dumps({
+                landmarks_flat = message.get("landmarks_flat")
+
+                flat = None
+                if landmarks_flat is not None and len(landmarks_flat) == 63:
+                    # Preferred flat format: one array construction, no dict walks
+                    flat = np.asarray(landmarks_flat, dtype=np.float32)
+                elif landmarks and len(landmarks) == 21:
+                    flat = np.fromiter(
+                        (lm.get(k, 0) for lm in landmarks for k in ("x", "y", "z")),
+                        dtype=np.float32,
+                        count=63
+                    )
+
+                last_landmarks = conn["last_landmarks"]
+                last_result = conn["last_result"]
+
+                if (flat is not None and last_landmarks is not None and last_result is not None
+                        and conn["frames_since_recompute"] < force_recompute_every
+                        and last_result.get("stability", 0.0) > 0.8
+                        and float(np.abs(flat - last_landmarks).sum()) < skip_eps):
+                    # Hand is steady and the last result was stable: echo it
+                    conn["frames_since_recompute"] += 1
+                    result = dict(last_result)
+                    result["cached"] = True
+                else:
+                    result = conn["recognizer"].recognize_from_landmarks(
+                        flat if flat is not None else landmarks
+                    )
+                    conn["last_landmarks"] = flat
+                    conn["last_result"] = result
+                    conn["frames_since_recompute"] = 0
+
+                await manager.send_personal_message(_ws_dumps({
                     "type": "gesture_result",
                     "data": result,
                     "timestamp": timestamp
                 }), websocket)
                 
+            elif message_type == "gesture_landmarks_batch":
+                # Process a whole batch of frames in one vectorized call
+                frames = message.get("frames", [])
+
+                try:
+                    arr = np.asarray(frames, dtype=np.float32).reshape(-1, 21, 3)
+                except ValueError:
+                    await manager.send_personal_message(_ws_dumps({
+                        "type": "error",
+                        "message": "frames must be N x 21 x 3 (or N x 63) landmark arrays",
+                        "timestamp": timestamp
+                    }), websocket)
+                    continue
+
+                results = conn["recognizer"].recognize_batch(arr)
+
+                await manager.send_personal_message(_ws_dumps({
+                    "type": "gesture_result_batch",
+                    "results": results,
+                    "timestamp": timestamp
+                }), websocket)
+
             elif message_type == "translate_text":
                 # Translate text to sign using SLT
                 if SLT_AVAILABLE:
@@ -665,10 +938,11 @@ async def websocket_real_time(websocket: WebSocket):
                         try:
                             model_key = f"{language}_to_landmarks"
                             if model_key in state.slt_models:
-                                model = state.slt_models[model_key]
-                                sign_result = model.translate(text)
+                                sign_result = await asyncio.to_thread(
+                                    _translate_cached, model_key, text.strip().lower()
+                                )
                                 
-                                await manager.send_personal_message(json.dumps({
+                                await manager.send_personal_message(_ws_dumps({
                                     "type": "translation_result",
                                     "data": {
                                         "text": text,
@@ -679,7 +953,7 @@ async def websocket_real_time(websocket: WebSocket):
                                     "timestamp": timestamp
                                 }), websocket)
                         except Exception as e:
-                            await manager.send_personal_message(json.dumps({
+                            await manager.send_personal_message(_ws_dumps({
                                 "type": "error",
                                 "message": f"Translation error: {str(e)}",
                                 "timestamp": timestamp
@@ -687,7 +961,7 @@ async def websocket_real_time(websocket: WebSocket):
                             
             elif message_type == "ping":
                 # Health check ping
-                await manager.send_personal_message(json.dumps({
+                await manager.send_personal_message(_ws_dumps({
                     "type": "pong",
                     "timestamp": timestamp,
                     "server_status": "running"
@@ -700,26 +974,33 @@ async def websocket_real_time(websocket: WebSocket):
         logger.error(f"WebSocket error: {e}")
         manager.disconnect(websocket)
 
-# === File Serving (for videos) ===
-
-@app.get("/files/video/{filename}")
-async def serve_video(filename: str):
-    """Serve generated video files"""
-    # This would serve SLT-generated videos
-    # Implementation depends on where SLT saves videos
-    file_path = Path(f"./generated_videos/{filename}")
-    
-    if file_path.exists():
-        return FileResponse(file_path)
-    else:
-        raise HTTPException(status_code=404, detail="Video file not found")
-
 if __name__ == "__main__":
+    import os
     import uvicorn
+
+    # uvloop + httptools cut per-request CPU substantially on Linux; fall back
+    # to the asyncio defaults where they aren't installed
+    try:
+        import uvloop  # noqa: F401
+        loop_impl = "uvloop"
+    except ImportError:
+        loop_impl = "auto"
+
+    try:
+        import httptools  # noqa: F401
+        http_impl = "httptools"
+    except ImportError:
+        http_impl = "auto"
+
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        loop=loop_impl,
+        http=http_impl,
+        # Note: SLT models are duplicated per worker; keep WORKERS=1 when
+        # memory-constrained or GPU-backed
+        workers=int(os.getenv("WORKERS", "1")),
+        reload=os.getenv("DEV") == "1",
         log_level="info"
-    ) 
\ No newline at end of file
+    )
\ No newline at end of file
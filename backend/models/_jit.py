@@ -0,0 +1,77 @@
+"""
+Numba-compiled kernel for the simple gesture recognizer
+Fuses finger analysis and pattern matching into one JIT-compiled function
+"""
+
+import numpy as np
+
+# Prefer the AOT-compiled kernel when the platform extension has been built
+# (see models/_native.py); it has zero warm-up cost after worker fork/reload
+try:
+    from recognizer_native import extension_mask as native_extension_mask
+except ImportError:
+    native_extension_mask = None
+
+# Numba integration (optional, falls back to pure Python in main.py)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Gesture ids returned by the compiled kernel, mapped back to letters by the caller
+GESTURE_NAMES = ("Unknown", "A", "B", "D", "E", "I", "L", "Y")
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True)
+    def recognize(points):
+        """
+        Fused finger analysis + pattern matching on a (21, 3) float32 array
+        Returns (gesture_id, confidence, extension_bitmask)
+        """
+        # Finger extension flags (thumb extends sideways, others upward)
+        thumb = points[4, 0] > points[3, 0] + 0.02
+        index = points[8, 1] < points[6, 1] - 0.02
+        middle = points[12, 1] < points[10, 1] - 0.02
+        ring = points[16, 1] < points[14, 1] - 0.02
+        pinky = points[20, 1] < points[18, 1] - 0.02
+
+        mask = 0
+        if thumb:
+            mask |= 1
+        if index:
+            mask |= 2
+        if middle:
+            mask |= 4
+        if ring:
+            mask |= 8
+        if pinky:
+            mask |= 16
+
+        fingers_up = int(index) + int(middle) + int(ring) + int(pinky)
+        all_down = fingers_up == 0
+
+        # Same pattern ladder as SimpleGestureRecognizer._match_pattern
+        if all_down and thumb:
+            return 1, np.float32(0.85), mask  # A
+        elif fingers_up == 4 and not thumb:
+            return 2, np.float32(0.90), mask  # B
+        elif index and fingers_up == 1:
+            return 3, np.float32(0.80), mask  # D
+        elif all_down:
+            return 4, np.float32(0.75), mask  # E
+        elif pinky and fingers_up == 1:
+            return 5, np.float32(0.80), mask  # I
+        elif thumb and index and fingers_up == 1:
+            return 6, np.float32(0.85), mask  # L
+        elif thumb and pinky and fingers_up == 1:
+            return 7, np.float32(0.85), mask  # Y
+        else:
+            return 0, np.float32(0.3), mask  # Unknown
+
+    # Warm the compilation cache so the first websocket frame doesn't pay JIT cost
+    recognize(np.zeros((21, 3), np.float32))
+
+else:
+    recognize = None
@@ -0,0 +1,127 @@
+"""
+Numba-compiled kernel for the two-layer rule-based recognizer
+Fuses geometric feature extraction and finger-state analysis into one function
+"""
+
+import numpy as np
+
+# Numba integration (optional, falls back to NumPy in gesture_recognizer.py)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Finger-state bits packed into the uint16 mask returned by the kernel;
+# the Python caller expands these into a dict only when branching on them
+THUMB_EXTENDED = 1 << 0
+THUMB_UP = 1 << 1
+THUMB_CURLED = 1 << 2
+INDEX_EXTENDED = 1 << 3
+INDEX_CURLED = 1 << 4
+MIDDLE_EXTENDED = 1 << 5
+MIDDLE_CURLED = 1 << 6
+RING_EXTENDED = 1 << 7
+RING_CURLED = 1 << 8
+PINKY_EXTENDED = 1 << 9
+PINKY_CURLED = 1 << 10
+PALM_FACING = 1 << 11
+
+# Feature vector layout: 5 tip distances, 5 finger angles,
+# 4 inter-tip distances, 1 palm curvature. Distances are SQUARED —
+# rule thresholds compare against squared values and sqrt is applied
+# only at the API boundary (see gesture_recognizer._sqrt_distance_features)
+N_FEATURES = 15
+
+_TIPS = np.array([4, 8, 12, 16, 20])
+_BASES = np.array([1, 5, 9, 13, 17])
+_KNUCKLES = np.array([2, 5, 9, 13, 17])
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True)
+    def compute_features_and_states(arr, out):
+        """
+        Fused feature extraction + finger-state analysis on a (21, 3) array
+        Writes the 15 geometric features into ``out`` and returns
+        (state_bitmask, hand_openness_sq, wrist_angle)
+        """
+        # Squared finger tip distances from palm center (wrist)
+        for i in range(5):
+            t = _TIPS[i]
+            dx = arr[t, 0] - arr[0, 0]
+            dy = arr[t, 1] - arr[0, 1]
+            dz = arr[t, 2] - arr[0, 2]
+            out[i] = dx * dx + dy * dy + dz * dz
+
+        # Finger angles relative to palm
+        for i in range(5):
+            t = _TIPS[i]
+            b = _BASES[i]
+            out[5 + i] = np.arctan2(arr[t, 1] - arr[b, 1], arr[t, 0] - arr[b, 0])
+
+        # Squared inter-finger distances (adjacent tips, x/y plane)
+        for i in range(4):
+            t1 = _TIPS[i]
+            t2 = _TIPS[i + 1]
+            dx = arr[t2, 0] - arr[t1, 0]
+            dy = arr[t2, 1] - arr[t1, 1]
+            out[10 + i] = dx * dx + dy * dy
+
+        # Palm curvature from knuckle segment angle changes
+        curvature = 0.0
+        prev = np.arctan2(
+            arr[_KNUCKLES[1], 1] - arr[_KNUCKLES[0], 1],
+            arr[_KNUCKLES[1], 0] - arr[_KNUCKLES[0], 0]
+        )
+        for i in range(1, 4):
+            ang = np.arctan2(
+                arr[_KNUCKLES[i + 1], 1] - arr[_KNUCKLES[i], 1],
+                arr[_KNUCKLES[i + 1], 0] - arr[_KNUCKLES[i], 0]
+            )
+            curvature += abs(ang - prev)
+            prev = ang
+        out[14] = curvature
+
+        # Finger-state bitmask (same thresholds as the NumPy fallback)
+        bits = 0
+        if arr[4, 0] > arr[3, 0] + 0.015:
+            bits |= THUMB_EXTENDED
+        if arr[4, 1] < arr[3, 1] - 0.01:
+            bits |= THUMB_UP
+        if arr[4, 1] > arr[3, 1] + 0.015:
+            bits |= THUMB_CURLED
+        if arr[8, 1] < arr[6, 1] - 0.015:
+            bits |= INDEX_EXTENDED
+        if arr[8, 1] > arr[6, 1] + 0.015:
+            bits |= INDEX_CURLED
+        if arr[12, 1] < arr[10, 1] - 0.015:
+            bits |= MIDDLE_EXTENDED
+        if arr[12, 1] > arr[10, 1] + 0.015:
+            bits |= MIDDLE_CURLED
+        if arr[16, 1] < arr[14, 1] - 0.015:
+            bits |= RING_EXTENDED
+        if arr[16, 1] > arr[14, 1] + 0.015:
+            bits |= RING_CURLED
+        if arr[20, 1] < arr[18, 1] - 0.015:
+            bits |= PINKY_EXTENDED
+        if arr[20, 1] > arr[18, 1] + 0.015:
+            bits |= PINKY_CURLED
+        if arr[9, 2] > arr[0, 2] + 0.01:
+            bits |= PALM_FACING
+
+        # Hand openness (mean squared tip distance in the x/y plane)
+        openness_sq = 0.0
+        for i in range(5):
+            t = _TIPS[i]
+            dx = arr[t, 0] - arr[0, 0]
+            dy = arr[t, 1] - arr[0, 1]
+            openness_sq += dx * dx + dy * dy
+        openness_sq /= 5.0
+
+        wrist_angle = np.arctan2(arr[9, 1] - arr[0, 1], arr[9, 0] - arr[0, 0])
+
+        return bits, openness_sq, wrist_angle
+
+else:
+    compute_features_and_states = None
@@ -0,0 +1,42 @@
+"""
+Ahead-of-time compiled gesture kernel
+Builds a recognizer_native extension specialized for the fixed (21, 3)
+float32 landmark shape so forked/reloaded workers skip JIT warm-up entirely
+
+Build standalone:   python -m models._native
+or via setup.py:    python setup.py build_ext --inplace
+"""
+
+try:
+    from numba.pycc import CC
+    NUMBA_PYCC_AVAILABLE = True
+except ImportError:
+    CC = None
+    NUMBA_PYCC_AVAILABLE = False
+
+if NUMBA_PYCC_AVAILABLE:
+    cc = CC('recognizer_native')
+
+    @cc.export('extension_mask', 'u1(f4[:,:])')
+    def extension_mask(points):
+        """Finger extension bitmask (bit0=thumb ... bit4=pinky) for one frame"""
+        mask = 0
+        if points[4, 0] > points[3, 0] + 0.02:  # Thumb extends sideways
+            mask |= 1
+        if points[8, 1] < points[6, 1] - 0.02:
+            mask |= 2
+        if points[12, 1] < points[10, 1] - 0.02:
+            mask |= 4
+        if points[16, 1] < points[14, 1] - 0.02:
+            mask |= 8
+        if points[20, 1] < points[18, 1] - 0.02:
+            mask |= 16
+        return mask
+
+else:
+    cc = None
+
+if __name__ == "__main__":
+    if cc is None:
+        raise SystemExit("numba is required to build the AOT recognizer kernel")
+    cc.compile()
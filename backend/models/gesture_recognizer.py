@@ -8,8 +8,12 @@ import numpy as np
 import cv2
 import base64
 import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import Dict, List, Optional, Union, Tuple
-from datetime import datetime
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
@@ -28,8 +32,87 @@ try:
 except ImportError:
     SLT_AVAILABLE = False
 
+# TurboJPEG integration (optional, SIMD-accelerated JPEG decoding)
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    TURBOJPEG_AVAILABLE = True
+except ImportError:
+    TURBOJPEG_AVAILABLE = False
+
+# Numba-compiled feature/finger-state kernel (optional, see models/_kernels.py)
+try:
+    from models import _kernels
+    KERNELS_AVAILABLE = _kernels.NUMBA_AVAILABLE
+except ImportError:
+    _kernels = None
+    KERNELS_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Landmark index arrays for vectorized feature extraction
+_TIP_IDX = np.array([4, 8, 12, 16, 20])        # Thumb, Index, Middle, Ring, Pinky
+_FINGER_BASE_IDX = np.array([1, 5, 9, 13, 17])
+_KNUCKLE_IDX = np.array([2, 5, 9, 13, 17])
+
+# Hand skeleton bones (wrist→MCP, MCP→PIP, PIP→DIP, DIP→tip per finger)
+# used for the direction-vector pose representation
+_BONE_PARENT_IDX = np.array([0, 1, 2, 3, 0, 5, 6, 7, 0, 9, 10, 11,
+                             0, 13, 14, 15, 0, 17, 18, 19])
+_BONE_CHILD_IDX = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12,
+                            13, 14, 15, 16, 17, 18, 19, 20])
+
+# Finger-state checks as (child point, parent point, axis, sign, threshold);
+# a check passes when sign * (child - parent) > threshold. Order matches the
+# finger-state dict built in _calculate_finger_states
+_STATE_CHECKS = (
+    (4, 3, 0, 1.0, 0.015),    # thumb_extended
+    (4, 3, 1, -1.0, 0.01),    # thumb_up
+    (4, 3, 1, 1.0, 0.015),    # thumb_curled
+    (8, 6, 1, -1.0, 0.015),   # index_extended
+    (8, 6, 1, 1.0, 0.015),    # index_curled
+    (12, 10, 1, -1.0, 0.015),  # middle_extended
+    (12, 10, 1, 1.0, 0.015),   # middle_curled
+    (16, 14, 1, -1.0, 0.015),  # ring_extended
+    (16, 14, 1, 1.0, 0.015),   # ring_curled
+    (20, 18, 1, -1.0, 0.015),  # pinky_extended
+    (20, 18, 1, 1.0, 0.015),   # pinky_curled
+    (9, 0, 2, 1.0, 0.01),      # palm_facing
+)
+_STATE_CHILD_FLAT = np.array([c * 3 + a for c, _, a, _, _ in _STATE_CHECKS])
+_STATE_PARENT_FLAT = np.array([p * 3 + a for _, p, a, _, _ in _STATE_CHECKS])
+_STATE_SIGN = np.array([s for _, _, _, s, _ in _STATE_CHECKS], dtype=np.float32)
+_STATE_THRESH = np.array([t for _, _, _, _, t in _STATE_CHECKS], dtype=np.float32)
+
+def _landmarks_to_array(landmarks: List["Landmark"]) -> np.ndarray:
+    """Pack a landmark list into a (21, 3) float32 array in one pass"""
+    return np.fromiter(
+        (v for lm in landmarks for v in (lm.x, lm.y, lm.z)),
+        dtype=np.float32,
+        count=63
+    ).reshape(21, 3)
+
+# Quantization scale shared with the websocket binary protocol in
+# main.py (21x3 int16 frames); both sides must divide/multiply by this
+LANDMARK_INT16_SCALE = 10000.0
+
+def encode_landmarks_int16(arr: np.ndarray) -> str:
+    """Quantize landmarks to int16 and base64-encode for transport
+
+    Uses the same x10000 scale as the websocket binary frame protocol,
+    so payloads stay interchangeable between the two paths. MediaPipe
+    coordinates carry ~9 meaningful bits, so the 126-byte payload loses
+    nothing a client can use while being ~10x smaller than JSON floats.
+    """
+    return base64.b64encode(
+        np.round(arr * LANDMARK_INT16_SCALE).astype("<i2").tobytes()
+    ).decode("ascii")
+
+def decode_landmarks_int16(data: str) -> np.ndarray:
+    """Inverse of encode_landmarks_int16, back to a (21, 3) float32 array"""
+    flat = np.frombuffer(base64.b64decode(data), dtype="<i2").astype(np.float32)
+    flat /= LANDMARK_INT16_SCALE
+    return flat.reshape(-1, 3)
+
 # === Data Classes ===
 
 @dataclass
@@ -51,7 +134,7 @@ class GestureResult:
     secondary_classification: Optional[str] = None
     confusion_group: Optional[str] = None
     geometric_features: Optional[List[float]] = None
-    landmarks: Optional[List[Landmark]] = None
+    landmarks: Optional[np.ndarray] = None
     raw_prediction: Optional[Dict] = None
 
 class RecognitionMethod(Enum):
@@ -80,7 +163,26 @@ class BaseGestureRecognizer(ABC):
     async def recognize(self, **kwargs) -> GestureResult:
         """Recognize gesture from input data"""
         pass
-    
+
+    async def recognize_dict(self, **kwargs) -> Dict:
+        """Recognize and return the API response dict
+
+        Subclasses on the hot path override this to build the dict directly
+        and skip the GestureResult round-trip.
+        """
+        result = await self.recognize(**kwargs)
+        return {
+            "gesture": result.primary_gesture,
+            "confidence": result.confidence,
+            "stability_score": result.stability_score,
+            "processing_time": result.processing_time_ms,
+            "method": result.method,
+            "secondary_classification": result.secondary_classification,
+            "confusion_group": result.confusion_group,
+            "geometric_features": result.geometric_features,
+            "landmarks_count": len(result.landmarks) if result.landmarks is not None else 0
+        }
+
     def is_ready(self) -> bool:
         """Check if recognizer is ready to use"""
         return self.is_initialized and self.model is not None
@@ -89,86 +191,154 @@ class BaseLandmarkProcessor(ABC):
     """Abstract base class for landmark processing"""
     
     @abstractmethod
-    def extract_landmarks(self, frame: np.ndarray) -> List[Landmark]:
-        """Extract landmarks from video frame"""
+    async def extract_landmarks(self, frame: np.ndarray) -> Optional[np.ndarray]:
+        """Extract landmarks from video frame as a (21, 3) array"""
         pass
-    
+
     @abstractmethod
-    def normalize_landmarks(self, landmarks: List[Landmark]) -> List[Landmark]:
+    def normalize_landmarks(self, landmarks: np.ndarray) -> np.ndarray:
         """Normalize landmarks for consistent processing"""
         pass
 
 # === Concrete Implementations ===
 
+class _HandsPool:
+    """Process-wide pool of MediaPipe Hands graphs
+
+    Graph construction wires up the full calculator pipeline (on the order
+    of 100MB of state), so exactly one graph exists per configuration and
+    is shared across processors and worker threads. Hands is not
+    thread-safe, so each graph comes with a lock that callers must hold
+    around process().
+    """
+
+    _instances: Dict[Tuple, Tuple[object, threading.Lock]] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def acquire(cls, cfg: Tuple) -> Tuple[object, threading.Lock]:
+        """Return the shared (graph, lock) pair for ``cfg``"""
+        entry = cls._instances.get(cfg)
+        if entry is None:
+            with cls._lock:
+                entry = cls._instances.get(cfg)
+                if entry is None:
+                    model_complexity, max_num_hands, det_conf, track_conf = cfg
+                    hands = mp.solutions.hands.Hands(
+                        static_image_mode=False,
+                        max_num_hands=max_num_hands,
+                        model_complexity=model_complexity,
+                        min_detection_confidence=det_conf,
+                        min_tracking_confidence=track_conf
+                    )
+                    entry = (hands, threading.Lock())
+                    cls._instances[cfg] = entry
+        return entry
+
 class MediaPipeLandmarkProcessor(BaseLandmarkProcessor):
     """MediaPipe-based landmark extraction"""
-    
-    def __init__(self):
+
+    # Motion gate: L1 distance over a 32x24 grayscale thumbnail below which
+    # the frame is considered static and the previous landmarks are reused
+    # (~2.6 gray levels per pixel on average)
+    MOTION_GATE_THRESH = 2000.0
+
+    def __init__(self, model_complexity: int = 0):
         if not MEDIAPIPE_AVAILABLE:
             raise ImportError("MediaPipe not available. Install with: pip install mediapipe")
-            
+
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=1,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.7
+        # 0 = "lite" model, ~2x faster and sufficient for a large centered
+        # hand; pass 1 for the full model when accuracy matters more
+        self.model_complexity = model_complexity
+        # Route the colour conversion through OpenCL (UMat) when a device is
+        # available; MediaPipe's Python API only accepts host arrays, so the
+        # frame is downloaded again before inference
+        try:
+            self._use_opencl = bool(cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL())
+        except Exception:
+            self._use_opencl = False
+        self._last_thumb: Optional[np.ndarray] = None
+        self._last_landmarks: Optional[np.ndarray] = None
+        # MediaPipe inference runs on this pool so it never blocks the event
+        # loop; workers share one Hands graph per configuration (serialized
+        # by its lock) and keep a reused RGB buffer via threading.local
+        self._mp_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="mp-hands")
+        self._local = threading.local()
+
+    def _get_hands(self) -> Tuple[object, threading.Lock]:
+        """Shared MediaPipe Hands graph and its lock from the pool"""
+        return _HandsPool.acquire((self.model_complexity, 1, 0.7, 0.7))
+
+    async def extract_landmarks(self, frame: np.ndarray) -> Optional[np.ndarray]:
+        """Extract hand landmarks from frame as a (21, 3) float32 array"""
+        # Cheap similarity gate (~50µs) before the ~15ms MediaPipe call:
+        # a user holding a sign produces near-identical consecutive frames
+        thumb = cv2.cvtColor(cv2.resize(frame, (32, 24)), cv2.COLOR_BGR2GRAY)
+        if (self._last_thumb is not None
+                and cv2.norm(thumb, self._last_thumb, cv2.NORM_L1) < self.MOTION_GATE_THRESH):
+            return self._last_landmarks
+
+        loop = asyncio.get_running_loop()
+        landmarks = await loop.run_in_executor(
+            self._mp_executor, self._extract_landmarks_sync, frame
         )
-        
-    def extract_landmarks(self, frame: np.ndarray) -> Optional[List[Landmark]]:
-        """Extract hand landmarks from frame"""
+        self._last_thumb = thumb
+        self._last_landmarks = landmarks
+        return landmarks
+
+    def _extract_landmarks_sync(self, frame: np.ndarray) -> Optional[np.ndarray]:
+        """Blocking extraction, executed on the MediaPipe worker pool"""
         try:
-            # Convert BGR to RGB
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.hands.process(rgb_frame)
-            
+            # Convert BGR to RGB into this thread's reused buffer
+            # (frames are a fixed size per client, so this avoids ~900KB
+            # of allocation per frame at 30 FPS)
+            if self._use_opencl:
+                # GPU colour conversion; .get() brings the frame back for
+                # MediaPipe, which only takes host ndarrays from Python
+                rgb_buf = cv2.cvtColor(cv2.UMat(frame), cv2.COLOR_BGR2RGB).get()
+            else:
+                rgb_buf = getattr(self._local, "rgb_buf", None)
+                if rgb_buf is None or rgb_buf.shape != frame.shape:
+                    rgb_buf = np.empty_like(frame)
+                    self._local.rgb_buf = rgb_buf
+                cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_buf)
+            hands, hands_lock = self._get_hands()
+            with hands_lock:
+                results = hands.process(rgb_buf)
+
             if results.multi_hand_landmarks:
                 hand_landmarks = results.multi_hand_landmarks[0]
-                landmarks = []
-                
-                for landmark in hand_landmarks.landmark:
-                    landmarks.append(Landmark(
-                        x=landmark.x,
-                        y=landmark.y,
-                        z=landmark.z,
-                        confidence=1.0  # MediaPipe doesn't provide per-landmark confidence
-                    ))
-                
-                return landmarks
-            
+                return np.fromiter(
+                    (v for lm in hand_landmarks.landmark for v in (lm.x, lm.y, lm.z)),
+                    dtype=np.float32,
+                    count=63
+                ).reshape(21, 3)
+
             return None
-            
+
         except Exception as e:
-            logger.error(f"Landmark extraction error: {e}")
+            logger.error("Landmark extraction error: %s", e)
             return None
-    
-    def normalize_landmarks(self, landmarks: List[Landmark]) -> List[Landmark]:
-        """Normalize landmarks relative to wrist"""
-        if not landmarks or len(landmarks) != 21:
+
+    def normalize_landmarks(self, landmarks: Union[np.ndarray, List[Landmark]]) -> Union[np.ndarray, List[Landmark]]:
+        """Normalize landmarks relative to wrist, in place on the array"""
+        # Legacy ingress: pack Landmark lists into an array first
+        if landmarks is not None and not isinstance(landmarks, np.ndarray):
+            if len(landmarks) != 21:
+                return landmarks
+            landmarks = _landmarks_to_array(landmarks)
+        if landmarks is None or landmarks.shape[0] != 21:
             return landmarks
-            
-        # Use wrist (landmark 0) as reference
-        wrist = landmarks[0]
-        
-        # Calculate bounding box for scale normalization
-        x_coords = [lm.x for lm in landmarks]
-        y_coords = [lm.y for lm in landmarks]
-        
-        min_x, max_x = min(x_coords), max(x_coords)
-        min_y, max_y = min(y_coords), max(y_coords)
-        
-        scale = max(max_x - min_x, max_y - min_y) or 1.0
-        
-        normalized = []
-        for landmark in landmarks:
-            normalized.append(Landmark(
-                x=(landmark.x - wrist.x) / scale,
-                y=(landmark.y - wrist.y) / scale,
-                z=(landmark.z - wrist.z) / scale,
-                confidence=landmark.confidence
-            ))
-            
-        return normalized
+
+        # Bounding-box scale (translation-invariant, so computed before the shift)
+        scale = max(np.ptp(landmarks[:, 0]), np.ptp(landmarks[:, 1])) or 1.0
+
+        # Shift to wrist-relative coordinates and rescale without reallocating
+        wrist = landmarks[0].copy()
+        landmarks -= wrist
+        landmarks /= scale
+        return landmarks
 
 class TwoLayerRuleBasedRecognizer(BaseGestureRecognizer):
     """Our enhanced two-layer rule-based recognizer"""
@@ -184,192 +354,319 @@ class TwoLayerRuleBasedRecognizer(BaseGestureRecognizer):
         "two_three_fingers": ["V", "W"],
         "horizontal_gestures": ["G", "H"]
     }
-    
+
+    # Flattened membership views, computed once at class definition time
+    _CONFUSION_MEMBERS = frozenset(g for group in CONFUSION_GROUPS.values() for g in group)
+    _GESTURE_TO_GROUP: Dict[str, str] = {}
+    for _name, _group in CONFUSION_GROUPS.items():
+        for _g in _group:
+            _GESTURE_TO_GROUP.setdefault(_g, _name)
+    del _name, _group, _g
+
+    # Primary rule definitions: (gesture, confidence, extension mask, feature guard)
+    # Mask bits: 1=thumb, 2=index, 4=middle, 8=ring, 16=pinky extended.
+    # Openness guards compare squared thresholds (0.3² and 0.7²) so the
+    # feature kernel never has to take a square root.
+    PRIMARY_RULES = (
+        ("A", 0.92, 0b00001, lambda fs: fs["hand_openness_sq"] < 0.09),
+        ("B", 0.90, 0b11110, lambda fs: fs["hand_openness_sq"] > 0.49),
+    )
+
     def __init__(self):
         super().__init__(RecognitionMethod.TWO_LAYER_RULE_BASED)
-        self.gesture_history: List[str] = []
-        self.confidence_history: List[float] = []
+        # Materialize the rule definitions into a mask-keyed lookup table so
+        # classification is one hash probe instead of a branch ladder
+        self._rule_table: Dict[int, List[Tuple[str, float, Optional[callable]]]] = {}
+        for gesture, confidence, mask, guard in self.PRIMARY_RULES:
+            self._rule_table.setdefault(mask, []).append((gesture, confidence, guard))
         self.stability_threshold = 0.85
         self.history_size = 15
-        
+        self.gesture_history = deque(maxlen=self.history_size)
+        self.confidence_history = deque(maxlen=self.history_size)
+        # Running sum over the last 5 confidences avoids re-slicing per frame
+        self._recent_conf = deque(maxlen=5)
+        self._recent_conf_sum = 0.0
+        # Reused per-frame output buffers: the feature kernel writes into
+        # _feat_buf and the state dict keeps its keys across frames, so the
+        # hot path allocates nothing. Results are consumed within the same
+        # recognize() call, so the aliasing is safe.
+        self._feat_buf = np.zeros(_kernels.N_FEATURES if _kernels else 15, dtype=np.float32)
+        self._state_dict: Dict = {}
+
     async def initialize(self) -> bool:
         """Initialize the two-layer recognizer"""
         try:
-            # Initialize any required models or data
+            # Warm the JIT kernel so the first frame doesn't pay compilation cost
+            if KERNELS_AVAILABLE:
+                _kernels.compute_features_and_states(
+                    np.zeros((21, 3), np.float32), np.zeros(_kernels.N_FEATURES, np.float32)
+                )
             logger.info("✅ Two-layer rule-based recognizer initialized")
             self.is_initialized = True
             self.model = "two_layer_v2.0"
             return True
         except Exception as e:
-            logger.error(f"❌ Failed to initialize two-layer recognizer: {e}")
+            logger.error("❌ Failed to initialize two-layer recognizer: %s", e)
             return False
     
-    async def recognize(self, landmarks: List[Landmark], **kwargs) -> GestureResult:
+    async def recognize(self, landmarks: Union[np.ndarray, List[Landmark]], **kwargs) -> GestureResult:
         """Recognize gesture using two-layer approach"""
-        start_time = datetime.now()
-        
+        t0 = time.perf_counter_ns()
+
         try:
-            if not landmarks or len(landmarks) != 21:
-                return self._create_empty_result(start_time)
-            
-            # Step 1: Extract geometric features
-            geometric_features = self._extract_geometric_features(landmarks)
-            
-            # Step 2: Calculate advanced finger states
-            finger_states = self._calculate_finger_states(landmarks)
-            
-            # Step 3: Primary classification (Layer 1)
-            primary_result = self._primary_classification(finger_states, geometric_features)
-            
-            if not primary_result:
-                return self._create_empty_result(start_time)
-            
-            # Step 4: Secondary classification for confusion groups (Layer 2)
-            final_gesture = primary_result["gesture"]
-            final_confidence = primary_result["confidence"]
-            secondary_method = None
-            confusion_group = None
-            
-            if self._is_in_confusion_group(primary_result["gesture"]):
-                secondary_result = self._secondary_classification(
-                    primary_result["gesture"],
-                    finger_states,
-                    geometric_features
-                )
-                if secondary_result:
-                    final_gesture = secondary_result["gesture"]
-                    final_confidence = (primary_result["confidence"] + secondary_result["confidence"]) / 2
-                    secondary_method = secondary_result["method"]
-                    confusion_group = secondary_result["group"]
-            
-            # Step 5: Calculate stability score
-            stability_score = self._calculate_stability_score(final_gesture, final_confidence)
-            
-            processing_time = (datetime.now() - start_time).total_seconds() * 1000
-            
+            arr = self._coerce_landmarks(landmarks)
+            if arr is None:
+                return self._create_empty_result(t0)
+
+            core = self._recognize_core(arr)
+            if core is None:
+                return self._create_empty_result(t0)
+            gesture, confidence, stability, secondary_method, confusion_group, features = core
+
             return GestureResult(
-                primary_gesture=final_gesture,
-                confidence=final_confidence,
-                stability_score=stability_score,
-                processing_time_ms=processing_time,
+                primary_gesture=gesture,
+                confidence=confidence,
+                stability_score=stability,
+                processing_time_ms=(time.perf_counter_ns() - t0) * 1e-6,
                 method=self.method.value,
                 secondary_classification=secondary_method,
                 confusion_group=confusion_group,
-                geometric_features=geometric_features,
-                landmarks=landmarks
+                geometric_features=features,
+                # Stored results keep landmarks at half precision; normalized
+                # coordinates only carry ~9 meaningful bits anyway
+                landmarks=arr.astype(np.float16)
             )
-            
+
         except Exception as e:
-            logger.error(f"Recognition error: {e}")
-            return self._create_empty_result(start_time)
-    
-    def _extract_geometric_features(self, landmarks: List[Landmark]) -> List[float]:
-        """Extract geometric features from landmarks"""
-        features = []
-        
-        # Finger tip distances from palm center (wrist)
-        palm_center = landmarks[0]
-        finger_tips = [4, 8, 12, 16, 20]  # Thumb, Index, Middle, Ring, Pinky
-        
-        for tip_idx in finger_tips:
-            tip = landmarks[tip_idx]
-            distance = np.sqrt(
-                (tip.x - palm_center.x)**2 + 
-                (tip.y - palm_center.y)**2 + 
-                (tip.z - palm_center.z)**2
+            logger.error("Recognition error: %s", e)
+            return self._create_empty_result(t0)
+
+    async def recognize_dict(self, landmarks: Union[np.ndarray, List[Landmark]] = None, **kwargs) -> Dict:
+        """Fast path: build the API response dict directly, no dataclass round-trip"""
+        t0 = time.perf_counter_ns()
+
+        try:
+            arr = self._coerce_landmarks(landmarks)
+            core = self._recognize_core(arr) if arr is not None else None
+            if core is None:
+                return {
+                    "gesture": "Unknown",
+                    "confidence": 0.0,
+                    "stability_score": 0.0,
+                    "processing_time": (time.perf_counter_ns() - t0) * 1e-6,
+                    "method": self.method.value,
+                    "secondary_classification": None,
+                    "confusion_group": None,
+                    "geometric_features": None,
+                    "landmarks_count": 0
+                }
+            gesture, confidence, stability, secondary_method, confusion_group, features = core
+
+            return {
+                "gesture": gesture,
+                "confidence": confidence,
+                "stability_score": stability,
+                "processing_time": (time.perf_counter_ns() - t0) * 1e-6,
+                "method": self.method.value,
+                "secondary_classification": secondary_method,
+                "confusion_group": confusion_group,
+                "geometric_features": features,
+                "landmarks_count": int(arr.shape[0])
+            }
+
+        except Exception as e:
+            logger.error("Recognition error: %s", e)
+            return {
+                "gesture": "Unknown",
+                "confidence": 0.0,
+                "stability_score": 0.0,
+                "processing_time": (time.perf_counter_ns() - t0) * 1e-6,
+                "method": self.method.value,
+                "secondary_classification": None,
+                "confusion_group": None,
+                "geometric_features": None,
+                "landmarks_count": 0
+            }
+
+    @staticmethod
+    def _coerce_landmarks(landmarks: Union[np.ndarray, List[Landmark], None]) -> Optional[np.ndarray]:
+        """Accept legacy Landmark lists at the boundary, work on arrays internally"""
+        if landmarks is not None and not isinstance(landmarks, np.ndarray):
+            landmarks = _landmarks_to_array(landmarks) if len(landmarks) == 21 else None
+        if landmarks is None or landmarks.shape[0] != 21:
+            return None
+        # Upcast float16 history entries back to float32 for the kernels
+        if landmarks.dtype != np.float32:
+            landmarks = landmarks.astype(np.float32)
+        return landmarks
+
+    def _recognize_core(self, arr: np.ndarray) -> Optional[Tuple]:
+        """Shared two-layer pipeline; returns the raw result fields or None"""
+        # Steps 1-2: fused JIT kernel when available, NumPy fallback otherwise
+        if KERNELS_AVAILABLE:
+            state_bits, openness, wrist_angle = _kernels.compute_features_and_states(
+                arr, self._feat_buf
             )
-            features.append(distance)
-        
+            geometric_features = self._feat_buf
+            finger_states = self._finger_states_from_bits(
+                state_bits, float(openness), float(wrist_angle)
+            )
+        else:
+            geometric_features = self._extract_geometric_features(arr)
+            finger_states = self._calculate_finger_states(arr)
+
+        # Step 3: Primary classification (Layer 1)
+        primary_result = self._primary_classification(finger_states, geometric_features)
+
+        if not primary_result:
+            return None
+
+        # Step 4: Secondary classification for confusion groups (Layer 2)
+        final_gesture = primary_result["gesture"]
+        final_confidence = primary_result["confidence"]
+        secondary_method = None
+        confusion_group = None
+
+        if self._is_in_confusion_group(primary_result["gesture"]):
+            secondary_result = self._secondary_classification(
+                primary_result["gesture"],
+                finger_states,
+                geometric_features
+            )
+            if secondary_result:
+                final_gesture = secondary_result["gesture"]
+                final_confidence = (primary_result["confidence"] + secondary_result["confidence"]) / 2
+                secondary_method = secondary_result["method"]
+                confusion_group = secondary_result["group"]
+
+        # Step 5: Calculate stability score
+        stability_score = self._calculate_stability_score(final_gesture, final_confidence)
+
+        # sqrt only at the output boundary; classification compares squares
+        return (final_gesture, final_confidence, stability_score,
+                secondary_method, confusion_group,
+                self._sqrt_distance_features(geometric_features))
+
+
+    def _extract_geometric_features(self, arr: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Extract geometric features (squared distances) from a (21, 3) array
+
+        Writes into ``out`` (default: the instance buffer) and returns it.
+        """
+        if out is None:
+            out = self._feat_buf
+        tips = arr[_TIP_IDX]
+
+        # Squared finger tip distances from palm center (wrist)
+        d = tips - arr[0]
+        np.sum(d * d, axis=1, out=out[0:5])
+
         # Finger angles relative to palm
-        finger_bases = [1, 5, 9, 13, 17]
-        for i, tip_idx in enumerate(finger_tips):
-            base = landmarks[finger_bases[i]]
-            tip = landmarks[tip_idx]
-            angle = np.arctan2(tip.y - base.y, tip.x - base.x)
-            features.append(angle)
-        
-        # Inter-finger distances
-        for i in range(len(finger_tips) - 1):
-            tip1 = landmarks[finger_tips[i]]
-            tip2 = landmarks[finger_tips[i + 1]]
-            distance = np.sqrt((tip2.x - tip1.x)**2 + (tip2.y - tip1.y)**2)
-            features.append(distance)
-        
-        # Palm curvature estimation
-        knuckles = [2, 5, 9, 13, 17]
-        curvature = 0
-        for i in range(1, len(knuckles) - 1):
-            p1 = landmarks[knuckles[i - 1]]
-            p2 = landmarks[knuckles[i]]
-            p3 = landmarks[knuckles[i + 1]]
-            
-            angle1 = np.arctan2(p2.y - p1.y, p2.x - p1.x)
-            angle2 = np.arctan2(p3.y - p2.y, p3.x - p2.x)
-            curvature += abs(angle2 - angle1)
-        
-        features.append(curvature)
-        
-        return features
-    
-    def _calculate_finger_states(self, landmarks: List[Landmark]) -> Dict:
-        """Calculate advanced finger states"""
-        return {
-            # Basic finger extension
-            "thumb_extended": landmarks[4].x > landmarks[3].x + 0.015,
-            "thumb_up": landmarks[4].y < landmarks[3].y - 0.01,
-            "thumb_curled": landmarks[4].y > landmarks[3].y + 0.015,
-            
-            "index_extended": landmarks[8].y < landmarks[6].y - 0.015,
-            "index_curled": landmarks[8].y > landmarks[6].y + 0.015,
-            
-            "middle_extended": landmarks[12].y < landmarks[10].y - 0.015,
-            "middle_curled": landmarks[12].y > landmarks[10].y + 0.015,
-            
-            "ring_extended": landmarks[16].y < landmarks[14].y - 0.015,
-            "ring_curled": landmarks[16].y > landmarks[14].y + 0.015,
-            
-            "pinky_extended": landmarks[20].y < landmarks[18].y - 0.015,
-            "pinky_curled": landmarks[20].y > landmarks[18].y + 0.015,
-            
-            # Advanced features
-            "palm_facing": landmarks[9].z > landmarks[0].z + 0.01,
-            "hand_openness": self._calculate_hand_openness(landmarks),
-            "wrist_angle": np.arctan2(landmarks[9].y - landmarks[0].y, landmarks[9].x - landmarks[0].x)
-        }
+        bases = arr[_FINGER_BASE_IDX]
+        np.arctan2(tips[:, 1] - bases[:, 1], tips[:, 0] - bases[:, 0], out=out[5:10])
+
+        # Squared inter-finger distances (adjacent tips, x/y plane)
+        dt = np.diff(tips[:, :2], axis=0)
+        np.sum(dt * dt, axis=1, out=out[10:14])
+
+        # Palm curvature estimation from knuckle segment angle changes
+        knuckles = arr[_KNUCKLE_IDX]
+        segment_angles = np.arctan2(np.diff(knuckles[:, 1]), np.diff(knuckles[:, 0]))
+        out[14] = np.abs(np.diff(segment_angles)).sum()
+
+        return out
     
-    def _calculate_hand_openness(self, landmarks: List[Landmark]) -> float:
-        """Calculate hand openness score"""
-        finger_tips = [4, 8, 12, 16, 20]
-        palm_center = landmarks[0]
-        
-        total_distance = 0
-        for tip_idx in finger_tips:
-            tip = landmarks[tip_idx]
-            distance = np.sqrt(
-                (tip.x - palm_center.x)**2 + (tip.y - palm_center.y)**2
-            )
-            total_distance += distance
-        
-        return total_distance / len(finger_tips)
+    def _calculate_finger_states(self, arr: np.ndarray) -> Dict:
+        """Calculate advanced finger states with one vectorized compare"""
+        # All 12 boolean checks in a single SIMD-friendly pass (see _STATE_CHECKS)
+        flat = arr.ravel()
+        diffs = flat[_STATE_CHILD_FLAT] - flat[_STATE_PARENT_FLAT]
+        checks = (diffs * _STATE_SIGN) > _STATE_THRESH
+        d = self._state_dict
+        d["thumb_extended"] = bool(checks[0])
+        d["thumb_up"] = bool(checks[1])
+        d["thumb_curled"] = bool(checks[2])
+        d["index_extended"] = bool(checks[3])
+        d["index_curled"] = bool(checks[4])
+        d["middle_extended"] = bool(checks[5])
+        d["middle_curled"] = bool(checks[6])
+        d["ring_extended"] = bool(checks[7])
+        d["ring_curled"] = bool(checks[8])
+        d["pinky_extended"] = bool(checks[9])
+        d["pinky_curled"] = bool(checks[10])
+        d["palm_facing"] = bool(checks[11])
+        d["hand_openness_sq"] = self._calculate_hand_openness(arr)
+        d["wrist_angle"] = np.arctan2(arr[9, 1] - arr[0, 1], arr[9, 0] - arr[0, 0])
+        return d
+
+    def _calculate_hand_openness(self, arr: np.ndarray) -> float:
+        """Calculate hand openness score (mean squared tip distance)"""
+        d = arr[_TIP_IDX, :2] - arr[0, :2]
+        return float((d * d).sum(axis=1).mean())
+
+    @staticmethod
+    def _direction_features(arr: np.ndarray) -> np.ndarray:
+        """Unit direction vectors along the 20 hand bones, flattened to (60,)
+
+        Translation- and scale-invariant pose representation: gesture
+        prototypes can be matched with a single ``dirs @ proto`` dot product
+        instead of threshold ladders. Classifier prototypes plug in here as
+        they are trained; the representation is exposed now so batch and
+        debug tooling can collect it.
+        """
+        diffs = arr[_BONE_CHILD_IDX] - arr[_BONE_PARENT_IDX]
+        norms = np.linalg.norm(diffs, axis=1, keepdims=True)
+        dirs = diffs / np.maximum(norms, 1e-8)
+        return dirs.ravel()
+
+    @staticmethod
+    def _sqrt_distance_features(features_sq: Union[np.ndarray, List[float]]) -> List[float]:
+        """Convert the squared distance slots back to distances for API output"""
+        out = features_sq.tolist() if isinstance(features_sq, np.ndarray) else list(features_sq)
+        for i in range(5):
+            out[i] = out[i] ** 0.5
+        for i in range(10, 14):
+            out[i] = out[i] ** 0.5
+        return out
+
+    def _finger_states_from_bits(self, bits: int, openness_sq: float, wrist_angle: float) -> Dict:
+        """Expand the kernel's uint16 state bitmask into the finger-state dict"""
+        d = self._state_dict
+        d["thumb_extended"] = bool(bits & _kernels.THUMB_EXTENDED)
+        d["thumb_up"] = bool(bits & _kernels.THUMB_UP)
+        d["thumb_curled"] = bool(bits & _kernels.THUMB_CURLED)
+        d["index_extended"] = bool(bits & _kernels.INDEX_EXTENDED)
+        d["index_curled"] = bool(bits & _kernels.INDEX_CURLED)
+        d["middle_extended"] = bool(bits & _kernels.MIDDLE_EXTENDED)
+        d["middle_curled"] = bool(bits & _kernels.MIDDLE_CURLED)
+        d["ring_extended"] = bool(bits & _kernels.RING_EXTENDED)
+        d["ring_curled"] = bool(bits & _kernels.RING_CURLED)
+        d["pinky_extended"] = bool(bits & _kernels.PINKY_EXTENDED)
+        d["pinky_curled"] = bool(bits & _kernels.PINKY_CURLED)
+        d["palm_facing"] = bool(bits & _kernels.PALM_FACING)
+        d["hand_openness_sq"] = openness_sq
+        d["wrist_angle"] = wrist_angle
+        return d
     
+    @staticmethod
+    def _extension_mask(finger_states: Dict) -> int:
+        """Pack the five extension flags into the rule-table key"""
+        return (
+            (1 if finger_states["thumb_extended"] else 0)
+            | (2 if finger_states["index_extended"] else 0)
+            | (4 if finger_states["middle_extended"] else 0)
+            | (8 if finger_states["ring_extended"] else 0)
+            | (16 if finger_states["pinky_extended"] else 0)
+        )
+
     def _primary_classification(self, finger_states: Dict, features: List[float]) -> Optional[Dict]:
-        """Primary gesture classification (Layer 1)"""
-        
-        # A: Closed fist with thumb on side
-        if (not finger_states["index_extended"] and not finger_states["middle_extended"] and
-            not finger_states["ring_extended"] and not finger_states["pinky_extended"] and
-            finger_states["thumb_extended"] and finger_states["hand_openness"] < 0.3):
-            return {"gesture": "A", "confidence": 0.92}
-        
-        # B: Four fingers up, thumb tucked
-        if (finger_states["index_extended"] and finger_states["middle_extended"] and
-            finger_states["ring_extended"] and finger_states["pinky_extended"] and
-            not finger_states["thumb_extended"] and finger_states["hand_openness"] > 0.7):
-            return {"gesture": "B", "confidence": 0.90}
-        
-        # Continue with more classifications...
-        # (Implementation would include all 26 letters)
-        
+        """Primary gesture classification (Layer 1) via rule-table lookup"""
+        mask = self._extension_mask(finger_states)
+        for gesture, confidence, guard in self._rule_table.get(mask, ()):
+            if guard is None or guard(finger_states):
+                return {"gesture": gesture, "confidence": confidence}
+
+        # New letters are added to PRIMARY_RULES rather than as branches here
         return None
     
     def _secondary_classification(self, primary_gesture: str, finger_states: Dict, features: List[float]) -> Optional[Dict]:
@@ -379,9 +676,9 @@ class TwoLayerRuleBasedRecognizer(BaseGestureRecognizer):
         if primary_gesture in ["D", "R", "U"]:
             if len(features) > 5:
                 index_angle = features[6]  # Index finger angle
-                thumb_distance = features[0]  # Thumb distance from palm
-                
-                if -0.5 < index_angle < 0.5 and thumb_distance > 0.05:
+                thumb_distance_sq = features[0]  # Squared thumb distance from palm
+
+                if -0.5 < index_angle < 0.5 and thumb_distance_sq > 0.0025:  # 0.05²
                     return {"gesture": "D", "confidence": 0.91, "method": "angle_analysis", "group": "DRU"}
                 elif index_angle > 0.5 and finger_states["middle_extended"]:
                     return {"gesture": "R", "confidence": 0.89, "method": "angle_analysis", "group": "DRU"}
@@ -396,32 +693,35 @@ class TwoLayerRuleBasedRecognizer(BaseGestureRecognizer):
         """Calculate gesture stability over time"""
         self.gesture_history.append(gesture)
         self.confidence_history.append(confidence)
-        
-        if len(self.gesture_history) > self.history_size:
-            self.gesture_history.pop(0)
-            self.confidence_history.pop(0)
-        
-        # Calculate consistency
-        recent_gestures = self.gesture_history[-5:]
-        consistent_gestures = sum(1 for g in recent_gestures if g == gesture)
-        consistency = consistent_gestures / len(recent_gestures) if recent_gestures else 0
-        
-        # Calculate average confidence
-        recent_confidence = self.confidence_history[-5:]
-        avg_confidence = sum(recent_confidence) / len(recent_confidence) if recent_confidence else 0
-        
+
+        # Maintain the last-5 confidence sum incrementally
+        if len(self._recent_conf) == self._recent_conf.maxlen:
+            self._recent_conf_sum -= self._recent_conf[0]
+        self._recent_conf.append(confidence)
+        self._recent_conf_sum += confidence
+
+        # Calculate consistency over the last 5 gestures without slicing
+        recent_n = min(len(self.gesture_history), 5)
+        consistent_gestures = sum(
+            1 for g in islice(reversed(self.gesture_history), recent_n) if g == gesture
+        )
+        consistency = consistent_gestures / recent_n if recent_n else 0
+
+        avg_confidence = self._recent_conf_sum / len(self._recent_conf) if self._recent_conf else 0
+
         return consistency * 0.6 + avg_confidence * 0.4
     
     def _is_in_confusion_group(self, gesture: str) -> bool:
         """Check if gesture is in any confusion group"""
-        for group_gestures in self.CONFUSION_GROUPS.values():
-            if gesture in group_gestures:
-                return True
-        return False
+        return gesture in self._CONFUSION_MEMBERS
+
+    def _confusion_group_of(self, gesture: str) -> Optional[str]:
+        """Name of the first confusion group containing the gesture, if any"""
+        return self._GESTURE_TO_GROUP.get(gesture)
     
-    def _create_empty_result(self, start_time: datetime) -> GestureResult:
+    def _create_empty_result(self, t0: int) -> GestureResult:
         """Create empty result for failed recognition"""
-        processing_time = (datetime.now() - start_time).total_seconds() * 1000
+        processing_time = (time.perf_counter_ns() - t0) * 1e-6
         return GestureResult(
             primary_gesture="Unknown",
             confidence=0.0,
@@ -449,19 +749,19 @@ class SLTEnhancedRecognizer(BaseGestureRecognizer):
             self.is_initialized = True
             return True
         except Exception as e:
-            logger.error(f"❌ Failed to initialize SLT recognizer: {e}")
+            logger.error("❌ Failed to initialize SLT recognizer: %s", e)
             return False
     
-    async def recognize(self, frame_data: str = None, landmarks: List[Landmark] = None, **kwargs) -> GestureResult:
+    async def recognize(self, frame_data: str = None, landmarks: Optional[np.ndarray] = None, **kwargs) -> GestureResult:
         """Recognize gesture using SLT framework"""
-        start_time = datetime.now()
-        
+        t0 = time.perf_counter_ns()
+
         try:
             # Convert landmarks to SLT format if needed
             # Implementation depends on SLT framework requirements
-            
+
             # For now, return a placeholder result
-            processing_time = (datetime.now() - start_time).total_seconds() * 1000
+            processing_time = (time.perf_counter_ns() - t0) * 1e-6
             
             return GestureResult(
                 primary_gesture="SLT_PROCESSED",
@@ -473,8 +773,8 @@ class SLTEnhancedRecognizer(BaseGestureRecognizer):
             )
             
         except Exception as e:
-            logger.error(f"SLT recognition error: {e}")
-            processing_time = (datetime.now() - start_time).total_seconds() * 1000
+            logger.error("SLT recognition error: %s", e)
+            processing_time = (time.perf_counter_ns() - t0) * 1e-6
             return GestureResult(
                 primary_gesture="Unknown",
                 confidence=0.0,
@@ -489,13 +789,20 @@ class AdvancedGestureRecognizer:
     """
     Main gesture recognizer that orchestrates multiple recognition methods
     """
-    
+
+    # Batching window for concurrent websocket frames: collect whatever
+    # arrives within 8ms (up to 16 frames) and process it in one wakeup
+    MAX_BATCH = 16
+    BATCH_WINDOW_S = 0.008
+
     def __init__(self):
         self.landmark_processor = MediaPipeLandmarkProcessor() if MEDIAPIPE_AVAILABLE else None
         self.recognizers: Dict[RecognitionMethod, BaseGestureRecognizer] = {}
         self.default_method = RecognitionMethod.TWO_LAYER_RULE_BASED
         self.frame_processor = self._setup_frame_processor()
-        
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._batch_task: Optional[asyncio.Task] = None
+
     async def initialize(self) -> bool:
         """Initialize all recognizers"""
         try:
@@ -510,11 +817,16 @@ class AdvancedGestureRecognizer:
                 if await slt_recognizer.initialize():
                     self.recognizers[RecognitionMethod.SLT_LANDMARKS] = slt_recognizer
             
-            logger.info(f"✅ Initialized {len(self.recognizers)} gesture recognizers")
+            # Start the frame batcher once recognizers are available
+            if self.recognizers and self._batch_task is None:
+                self._batch_queue = asyncio.Queue()
+                self._batch_task = asyncio.create_task(self._batch_worker())
+
+            logger.info("✅ Initialized %d gesture recognizers", len(self.recognizers))
             return len(self.recognizers) > 0
             
         except Exception as e:
-            logger.error(f"❌ Failed to initialize gesture recognizers: {e}")
+            logger.error("❌ Failed to initialize gesture recognizers: %s", e)
             return False
     
     async def recognize(self, frame_data: str = None, landmarks: List[dict] = None, method: RecognitionMethod = None) -> Dict:
@@ -535,20 +847,22 @@ class AdvancedGestureRecognizer:
             processed_landmarks = None
             
             if landmarks:
-                # Convert from dict format to Landmark objects
-                processed_landmarks = [
-                    Landmark(x=lm.get("x", 0), y=lm.get("y", 0), z=lm.get("z", 0))
-                    for lm in landmarks
-                ]
+                # Convert from dict format straight to a (N, 3) float32 array
+                processed_landmarks = np.fromiter(
+                    (lm.get(k, 0.0) for lm in landmarks for k in ("x", "y", "z")),
+                    dtype=np.float32,
+                    count=len(landmarks) * 3
+                ).reshape(-1, 3)
             elif frame_data and self.landmark_processor:
-                # Extract landmarks from frame
-                frame = self._decode_frame(frame_data)
+                # Decode off the event loop so concurrent frames overlap with inference
+                loop = asyncio.get_running_loop()
+                frame = await loop.run_in_executor(None, self._decode_frame, frame_data)
                 if frame is not None:
-                    extracted = self.landmark_processor.extract_landmarks(frame)
-                    if extracted:
+                    extracted = await self.landmark_processor.extract_landmarks(frame)
+                    if extracted is not None:
                         processed_landmarks = self.landmark_processor.normalize_landmarks(extracted)
-            
-            if not processed_landmarks:
+
+            if processed_landmarks is None or len(processed_landmarks) == 0:
                 return {
                     "gesture": "No Hand Detected",
                     "confidence": 0.0,
@@ -557,24 +871,16 @@ class AdvancedGestureRecognizer:
                     "error": "No valid landmarks found"
                 }
             
-            # Perform recognition
-            result = await recognizer.recognize(landmarks=processed_landmarks)
-            
-            # Convert to dict format for API response
-            return {
-                "gesture": result.primary_gesture,
-                "confidence": result.confidence,
-                "stability_score": result.stability_score,
-                "processing_time": result.processing_time_ms,
-                "method": result.method,
-                "secondary_classification": result.secondary_classification,
-                "confusion_group": result.confusion_group,
-                "geometric_features": result.geometric_features,
-                "landmarks_count": len(processed_landmarks) if processed_landmarks else 0
-            }
+            # Perform recognition (batched through the worker for the default method);
+            # recognizers emit the API response dict directly
+            if self._batch_queue is not None and method == self.default_method:
+                future = asyncio.get_running_loop().create_future()
+                await self._batch_queue.put((processed_landmarks, future))
+                return await future
+            return await recognizer.recognize_dict(landmarks=processed_landmarks)
             
         except Exception as e:
-            logger.error(f"Recognition error: {e}")
+            logger.error("Recognition error: %s", e)
             return {
                 "gesture": "Error",
                 "confidence": 0.0,
@@ -583,6 +889,29 @@ class AdvancedGestureRecognizer:
                 "error": str(e)
             }
     
+    async def _batch_worker(self):
+        """Drain frames arriving within the batch window and process them together"""
+        recognizer = self.recognizers[self.default_method]
+        while True:
+            batch = [await self._batch_queue.get()]
+            while len(batch) < self.MAX_BATCH:
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._batch_queue.get(), timeout=self.BATCH_WINDOW_S)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            # Stability history is sequential, so frames run in arrival order;
+            # the win is one event-loop wakeup amortized over the whole batch
+            for arr, future in batch:
+                if future.cancelled():
+                    continue
+                try:
+                    future.set_result(await recognizer.recognize_dict(landmarks=arr))
+                except Exception as e:
+                    future.set_exception(e)
+
     def is_ready(self) -> bool:
         """Check if at least one recognizer is ready"""
         return any(recognizer.is_ready() for recognizer in self.recognizers.values())
@@ -600,19 +929,34 @@ class AdvancedGestureRecognizer:
             
             # Decode base64
             img_data = base64.b64decode(frame_data)
+
+            # TurboJPEG decodes straight to a BGR ndarray via SIMD libjpeg-turbo;
+            # non-JPEG payloads fall through to cv2.imdecode below
+            if self._turbojpeg is not None:
+                try:
+                    return self._turbojpeg.decode(img_data, pixel_format=TJPF_BGR)
+                except Exception:
+                    pass
+
             nparr = np.frombuffer(img_data, np.uint8)
             frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-            
+
             return frame
-            
+
         except Exception as e:
-            logger.error(f"Frame decoding error: {e}")
+            logger.error("Frame decoding error: %s", e)
             return None
-    
+
     def _setup_frame_processor(self):
         """Setup frame processing utilities"""
+        self._turbojpeg = None
+        if TURBOJPEG_AVAILABLE:
+            try:
+                self._turbojpeg = TurboJPEG()
+            except Exception as e:
+                logger.warning("TurboJPEG unavailable, using cv2.imdecode: %s", e)
         # Can be extended with additional frame processing logic
         return {
             "resize_target": (640, 480),
             "quality_threshold": 0.5
-        } 
\ No newline at end of file
+        }
\ No newline at end of file
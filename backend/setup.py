@@ -30,9 +30,20 @@ def read_requirements():
         "opencv-python>=4.9.0.80", 
         "numpy>=1.26.0",
         "mediapipe>=0.10.8",
-            "pydantic>=2.5.0"
+            "pydantic>=2.5.0",
+            "orjson>=3.9.10"
         ]
 
+# Optional AOT-compiled gesture kernel (see models/_native.py); skipped
+# silently when numba is not installed
+ext_modules = []
+try:
+    from models._native import cc as _recognizer_cc
+    if _recognizer_cc is not None:
+        ext_modules.append(_recognizer_cc.distutils_extension())
+except Exception:
+    pass
+
 setup(
     name="slt-translator-backend",
     version="2.0.0",
@@ -50,16 +61,17 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
+        "Programming Language :: Python :: 3.12",
+        "Programming Language :: Python :: 3.13",
         "Topic :: Multimedia :: Video",
         "Topic :: Scientific/Engineering :: Artificial Intelligence",
         "Topic :: Scientific/Engineering :: Human Machine Interfaces",
         "Topic :: Software Development :: Libraries :: Python Modules",
     ],
-    python_requires=">=3.8,<3.13",
+    python_requires=">=3.9",
     install_requires=read_requirements(),
     extras_require={
         "dev": [
@@ -107,6 +119,7 @@ setup(
             "slt-server=main:run_server",
         ],
     },
+    ext_modules=ext_modules,
     include_package_data=True,
     package_data={
         "": ["*.txt", "*.md", "*.yml", "*.yaml", "*.json"],
@@ -139,12 +152,12 @@ setup(
 if __name__ == "__main__":
     print("Setting up Enhanced Sign Language Translator Backend...")
     print("This will install the SLT Framework and all dependencies")
-    print("Make sure you have Python 3.8+ installed")
+    print("Make sure you have Python 3.9+ installed")
     print()
-    
+
     # Check Python version
-    if sys.version_info < (3, 8):
-        print("Error: Python 3.8 or higher is required")
+    if sys.version_info < (3, 9):
+        print("Error: Python 3.9 or higher is required")
         sys.exit(1)
     
     print(f"Python {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro} detected")